@@ -15,7 +15,7 @@ FRONTEND_DIST = ROOT / "frontend" / "dist"
 FRONTEND_ASSETS = FRONTEND_DIST / "assets"
 NO_CACHE_HEADERS = {"Cache-Control": "no-store, max-age=0", "Pragma": "no-cache"}
 
-context = BattleSessionContext(root=ROOT)
+context = BattleSessionContext(root=ROOT, autosave_delay=2.0)
 
 _original_nicegui_setup = nicegui_run.setup
 
@@ -35,6 +35,7 @@ if FRONTEND_ASSETS.exists():
     app.add_static_files("/assets", str(FRONTEND_ASSETS))
 
 register_battle_api(app, context)
+app.on_shutdown(context.flush_autosaves)
 
 
 @app.get("/", include_in_schema=False)
@@ -4,6 +4,7 @@ import random
 from typing import Any, Literal, Optional
 
 from fastapi import File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from battle_session import (
@@ -445,18 +446,22 @@ def register_battle_api(api_app, context: BattleSessionContext) -> None:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     def run_mutation(sid: str, action, *, undoable: bool = True):
-        session = load_session_or_400(sid)
+        return apply_mutation(load_session_or_400(sid), action, undoable=undoable)
+
+    def apply_mutation(session, action, *, undoable: bool = True):
         before_payload = session.undo_payload() if undoable else None
-        try:
-            mutation_result = action(session)
-        except BattleSessionError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        if undoable:
-            after_payload = session.undo_payload()
-            if before_payload != after_payload:
-                session.remember_undo_state(before_payload)
-                session.autosave()
-        payload = session.snapshot()
+        after_payload = None
+        with session.coalesced_autosave():
+            try:
+                mutation_result = action(session)
+            except BattleSessionError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            if undoable:
+                after_payload = session.undo_payload()
+                if before_payload != after_payload:
+                    session.remember_undo_state(before_payload)
+                    session.autosave()
+        payload = session.snapshot(state_payload=after_payload)
         if isinstance(mutation_result, dict):
             payload.update(mutation_result)
         return payload
@@ -485,7 +490,11 @@ def register_battle_api(api_app, context: BattleSessionContext) -> None:
     async def upload_character_builder_art(file: UploadFile = File(...)):
         try:
             content = await file.read(8 * 1024 * 1024 + 1)
-            return context.save_character_art_upload(file.filename or "character_art.png", content)
+            return await run_in_threadpool(
+                context.save_character_art_upload,
+                file.filename or "character_art.png",
+                content,
+            )
         except BattleSessionError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -1125,19 +1134,13 @@ def register_battle_api(api_app, context: BattleSessionContext) -> None:
         session = load_session_or_400(sid)
         if session._scenario_source_id() != scenario_id:
             raise HTTPException(status_code=400, detail="Template does not match the active scenario run")
-        before_payload = session.undo_payload()
-        try:
+
+        def mutate(session):
             scenario = save_scenario_or_400(scenario_id, request.definition)
             session.update_scenario_run_definition(scenario)
-        except BattleSessionError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        after_payload = session.undo_payload()
-        if before_payload != after_payload:
-            session.remember_undo_state(before_payload)
-            session.autosave()
-        payload = session.snapshot()
-        payload.update({"scenarioTemplate": scenario, "scenarios": context.list_scenarios()})
-        return payload
+            return {"scenarioTemplate": scenario, "scenarios": context.list_scenarios()}
+
+        return apply_mutation(session, mutate)
 
     @api_app.post("/api/battle/sessions/{sid}/scenario/detach")
     def detach_scenario_from_session(sid: str):
@@ -1196,25 +1199,19 @@ def register_battle_api(api_app, context: BattleSessionContext) -> None:
 
     @api_app.post("/api/battle/sessions/{sid}/dungeon/save-as-template")
     def save_dungeon_as_map_template(sid: str, request: SaveMapTemplateRequest):
-        session = load_session_or_400(sid)
-        try:
-            result = session.save_dungeon_as_map_template(request.name)
-        except BattleSessionError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        payload = session.snapshot()
-        payload["savedTemplate"] = result
-        return payload
+        return run_mutation(
+            sid,
+            lambda session: {"savedTemplate": session.save_dungeon_as_map_template(request.name)},
+            undoable=False,
+        )
 
     @api_app.post("/api/battle/sessions/{sid}/dungeon/save-template/{template_id}")
     def save_dungeon_to_map_template(sid: str, template_id: str):
-        session = load_session_or_400(sid)
-        try:
-            result = session.save_dungeon_to_map_template(template_id)
-        except BattleSessionError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        payload = session.snapshot()
-        payload["savedTemplate"] = result
-        return payload
+        return run_mutation(
+            sid,
+            lambda session: {"savedTemplate": session.save_dungeon_to_map_template(template_id)},
+            undoable=False,
+        )
 
     @api_app.post("/api/battle/sessions/{sid}/dungeon/load-template/{template_id}")
     def load_map_template(sid: str, template_id: str):
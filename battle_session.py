@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 from collections import Counter
+from contextlib import contextmanager
 import copy
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 import hashlib
 import heapq
 import json
+import os
 from pathlib import Path
 import random
 import re
+import secrets
+import sys
 import threading
-import uuid
 from typing import Iterable, Optional
 
 from engine.combat import WOUND_CARD_ID, AttackMod, apply_attack, apply_heal
@@ -45,12 +48,13 @@ from engine.dungeon import analyze as dungeon_analyze
 from engine.dungeon import canonical_edge_key, migrate_to_dungeon, normalize_side
 from engine.excel_creatures import load_creatures_from_workbook, serialize_creature_action_card
 from engine.loader import load_decks
-from engine.loot import roll_loot
+from engine.loot import roll_loot_payload
 from engine.models import Card, Deck, Effect, EnemyTemplate, LootEntry
 from engine.runtime import BattleState, draw_additional_cards, draw_cards, end_turn, spawn_enemy, start_turn
 from engine.runtime_models import DeckState, DungeonState, DungeonWall, EnemyInstance, GrappleInstance, Tile, footprint_cells, footprint_for_size
 from persistence import (
     _atomic_write_json,
+    _encode_json,
     dungeon_state_from_dict,
     dungeon_state_to_dict,
     dungeon_state_to_map_template,
@@ -61,6 +65,7 @@ from persistence import (
     make_save_payload,
     restore_state_from_payload,
     save_current,
+    save_current_encoded,
 )
 
 LOG_LIMIT = 30
@@ -70,6 +75,8 @@ ROOM_DEFAULT_ROWS = 7
 SCENARIO_DEFAULT_ARENA_COLUMNS = 40
 SCENARIO_DEFAULT_ARENA_ROWS = 40
 PLAYER_DECK_ID = "human_fighter_lvl1"
+# \w is str.isalnum() plus "_", matching the characters manual save names keep.
+UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^\w\- ]+")
 HUMAN_FIGHTER_DEFAULTS = {
     "toughness": 4,
     "armor": 1,
@@ -134,17 +141,15 @@ def merge_loot_payload(target: dict, source: dict) -> dict:
 
 
 def create_sid() -> str:
-    return uuid.uuid4().hex[:12]
+    return secrets.token_hex(6)
 
 
 def uuid_short() -> str:
-    return uuid.uuid4().hex[:10]
+    return secrets.token_hex(5)
 
 
 def build_core_deck_ids(deck: Deck, rnd: random.Random) -> list[str]:
-    card_ids: list[str] = []
-    for card in deck.cards:
-        card_ids.extend([card.id] * card.weight)
+    card_ids = list(deck.weighted_card_ids)
     rnd.shuffle(card_ids)
     return card_ids
 
@@ -273,11 +278,7 @@ def spawn_player(
 
 
 def safe_filename(name: str) -> str:
-    keep: list[str] = []
-    for ch in name.strip():
-        if ch.isalnum() or ch in ("-", "_", " "):
-            keep.append(ch)
-    safe = "".join(keep).strip().replace(" ", "_")
+    safe = UNSAFE_FILENAME_CHARS_RE.sub("", name.strip()).strip().replace(" ", "_")
     return safe or "save"
 
 
@@ -499,6 +500,8 @@ class BattleSessionContext:
     map_templates_dir: Optional[Path] = None
     scenarios_dir: Optional[Path] = None
     save_version: int = 3
+    # Seconds to hold back autosave writes so bursts of actions land on disk once; 0 writes immediately.
+    autosave_delay: float = 0.0
 
     def __post_init__(self) -> None:
         self.root = Path(self.root)
@@ -534,6 +537,7 @@ class BattleSessionContext:
         self.manual_dir = self.saves_dir / "manual"
         self.character_dir = self.saves_dir / "characters"
         self.creature_workbook_backup_dir = self.saves_dir / BACKUP_DIR_NAME
+        self.cache_dir = self.saves_dir / ".cache"
         self._creature_workbook_lock = threading.Lock()
 
         self.saves_dir.mkdir(parents=True, exist_ok=True)
@@ -542,13 +546,26 @@ class BattleSessionContext:
         self.map_templates_dir.mkdir(parents=True, exist_ok=True)
         self.scenarios_dir.mkdir(parents=True, exist_ok=True)
 
-        self.decks = load_decks(self.decks_dir)
-        self.player_decks = load_decks(self.player_decks_dir) if self.player_decks_dir.exists() else {}
+        self.decks = load_decks(self.decks_dir, cache_path=self.cache_dir / "decks.pkl")
+        self.player_decks = (
+            load_decks(self.player_decks_dir, cache_path=self.cache_dir / "player_decks.pkl")
+            if self.player_decks_dir.exists()
+            else {}
+        )
+        # Decks never change after load, so their option lists are built once.
+        self._deck_options = self._deck_option_list(self.decks)
+        self._player_deck_options = self._deck_option_list(self.player_decks)
         self.character_catalog = load_character_catalog(self.character_catalog_path)
         self.enemy_templates = {}
         self.card_index = {}
+        self.guard_by_card_id = {}
+        self._image_url_cache: dict[tuple[str, str], str] = {}
+        self._template_image_urls: dict[tuple[str, str, str, str], str] = {}
+        self._card_text_cache: dict[str, str] = {}
+        self._template_catalog: Optional[list[dict]] = None
         self.reload_creature_templates()
         self._sessions: dict[str, BattleSession] = {}
+        self._directory_listings: dict[Path, dict[str, tuple[tuple[int, int], Optional[dict]]]] = {}
 
     def _build_card_index(self) -> dict[str, Card]:
         index: dict[str, Card] = {}
@@ -570,20 +587,20 @@ class BattleSessionContext:
         return self.saves_dir / f"_current_{sid}.json"
 
     def list_map_templates(self) -> list[dict]:
-        entries = []
-        for path in sorted(self.map_templates_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
-            try:
-                with path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except Exception:
-                continue
-            entries.append({
-                "id": path.stem,
-                "filename": path.name,
-                "name": data.get("name", path.stem),
-                "savedAt": data.get("saved_at"),
-            })
-        return entries
+        return self._cached_directory_listing(self.map_templates_dir, self._map_template_entry)
+
+    def _map_template_entry(self, path: Path) -> Optional[dict]:
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return None
+        return {
+            "id": path.stem,
+            "filename": path.name,
+            "name": data.get("name", path.stem),
+            "savedAt": data.get("saved_at"),
+        }
 
     def save_map_template(self, name: str, template_data: dict) -> dict:
         base = safe_filename(name)
@@ -597,6 +614,7 @@ class BattleSessionContext:
         template_data["name"] = name
         template_data["saved_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
         _atomic_write_json(path, template_data)
+        self._invalidate_directory_listing(self.map_templates_dir)
         return {"id": path.stem, "filename": filename, "name": name, "savedAt": template_data["saved_at"]}
 
     def get_map_template(self, template_id: str) -> Optional[dict]:
@@ -617,6 +635,7 @@ class BattleSessionContext:
         if not path.exists():
             raise ValueError(f"Map template '{template_id}' not found")
         path.unlink()
+        self._invalidate_directory_listing(self.map_templates_dir)
 
     def write_map_template(self, template_id: str, template_data: dict) -> dict:
         path = self._resolve_map_template_path(template_id)
@@ -626,6 +645,7 @@ class BattleSessionContext:
         data["name"] = str(data.get("name") or template_id)
         data["saved_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
         _atomic_write_json(path, data)
+        self._invalidate_directory_listing(self.map_templates_dir)
         return {"id": path.stem, "filename": path.name, "name": data["name"], "savedAt": data["saved_at"]}
 
     def _resolve_map_template_path(self, template_id: str) -> Path:
@@ -638,24 +658,24 @@ class BattleSessionContext:
         return path
 
     def list_scenarios(self) -> list[dict]:
-        entries = []
-        for path in sorted(self.scenarios_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
-            try:
-                with path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                scenario = normalize_scenario_definition(data, scenario_id=path.stem)
-            except Exception:
-                continue
-            entries.append({
-                "id": path.stem,
-                "filename": path.name,
-                "name": scenario.get("name", path.stem),
-                "startNodeId": scenario.get("startNodeId"),
-                "nodeCount": len(scenario.get("nodes") or []),
-                "edgeCount": len(scenario.get("edges") or []),
-                "savedAt": scenario.get("saved_at") or scenario.get("savedAt"),
-            })
-        return entries
+        return self._cached_directory_listing(self.scenarios_dir, self._scenario_entry)
+
+    def _scenario_entry(self, path: Path) -> Optional[dict]:
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            scenario = normalize_scenario_definition(data, scenario_id=path.stem)
+        except Exception:
+            return None
+        return {
+            "id": path.stem,
+            "filename": path.name,
+            "name": scenario.get("name", path.stem),
+            "startNodeId": scenario.get("startNodeId"),
+            "nodeCount": len(scenario.get("nodes") or []),
+            "edgeCount": len(scenario.get("edges") or []),
+            "savedAt": scenario.get("saved_at") or scenario.get("savedAt"),
+        }
 
     def create_scenario(self, name: str) -> dict:
         scenario_name = str(name or "New Scenario").strip() or "New Scenario"
@@ -682,6 +702,7 @@ class BattleSessionContext:
         }, scenario_id=scenario_id, name=scenario_name)
         scenario["saved_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
         _atomic_write_json(self._resolve_scenario_path(scenario_id), scenario)
+        self._invalidate_directory_listing(self.scenarios_dir)
         return scenario
 
     def duplicate_scenario(self, scenario_id: str, name: str | None = None) -> dict:
@@ -699,6 +720,7 @@ class BattleSessionContext:
         duplicate = normalize_scenario_definition(source, scenario_id=duplicate_id, name=duplicate_name)
         duplicate["saved_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
         _atomic_write_json(self._resolve_scenario_path(duplicate_id), duplicate)
+        self._invalidate_directory_listing(self.scenarios_dir)
         return duplicate
 
     def rename_scenario(self, scenario_id: str, name: str) -> dict:
@@ -729,6 +751,7 @@ class BattleSessionContext:
         scenario = normalize_scenario_definition(definition, scenario_id=path.stem)
         scenario["saved_at"] = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
         _atomic_write_json(path, scenario)
+        self._invalidate_directory_listing(self.scenarios_dir)
         return scenario
 
     def delete_scenario(self, scenario_id: str) -> None:
@@ -736,6 +759,7 @@ class BattleSessionContext:
         if not path.exists():
             raise ValueError(f"Scenario '{scenario_id}' not found")
         path.unlink()
+        self._invalidate_directory_listing(self.scenarios_dir)
 
     def _resolve_scenario_path(self, scenario_id: str) -> Path:
         import re as _re
@@ -809,6 +833,9 @@ class BattleSessionContext:
             raise BattleSessionError("Could not create a unique character art filename")
 
         target.write_bytes(content)
+        self._image_url_cache.clear()
+        self._template_image_urls.clear()
+        self._template_catalog = None
         image_path = target.relative_to(self.images_dir).as_posix()
         try:
             art = resolve_character_art(
@@ -860,6 +887,17 @@ class BattleSessionContext:
                 if loot and not getattr(template, "loot", ()):
                     self.enemy_templates[template_id] = replace(template, loot=loot)
         self.card_index = self._build_card_index()
+        self.guard_by_card_id = {
+            card_id: guard
+            for card_id, card in self.card_index.items()
+            if (guard := sum(int(effect.amount) for effect in card.effects if effect.type == "guard"))
+        }
+        self._card_text_cache.clear()
+        self._image_url_cache.clear()
+        self._template_image_urls.clear()
+        self._template_catalog = None
+        for template in self.enemy_templates.values():
+            self.template_image_url(template)
 
     def _load_legacy_loot_tables(self) -> dict[str, tuple[LootEntry, ...]]:
         loot_by_id: dict[str, tuple[LootEntry, ...]] = {}
@@ -878,8 +916,8 @@ class BattleSessionContext:
                     continue
                 loot.append(
                     LootEntry(
-                        type=str(entry["type"]),
-                        kind=entry.get("kind"),
+                        type=sys.intern(str(entry["type"])),
+                        kind=sys.intern(entry["kind"]) if isinstance(entry.get("kind"), str) else entry.get("kind"),
                         min=entry.get("min"),
                         max=entry.get("max"),
                         text=entry.get("text"),
@@ -915,7 +953,20 @@ class BattleSessionContext:
         }
 
     def metadata(self) -> dict:
-        templates = [
+        if self._template_catalog is None:
+            self._template_catalog = self._build_template_catalog()
+        return {
+            "enemyTemplates": self._template_catalog,
+            "decks": self._deck_options,
+            "playerDecks": self._player_deck_options,
+        }
+
+    @staticmethod
+    def _deck_option_list(decks: dict[str, Deck]) -> list[dict]:
+        return [{"id": deck_id, "name": deck.name} for deck_id, deck in sorted(decks.items(), key=lambda item: item[1].name.lower())]
+
+    def _build_template_catalog(self) -> list[dict]:
+        return [
             {
                 "id": template_id,
                 "name": template.name,
@@ -946,12 +997,6 @@ class BattleSessionContext:
             }
             for template_id, template in sorted(self.enemy_templates.items(), key=lambda item: item[1].name.lower())
         ]
-        decks = [{"id": deck_id, "name": deck.name} for deck_id, deck in sorted(self.decks.items(), key=lambda item: item[1].name.lower())]
-        player_decks = [
-            {"id": deck_id, "name": deck.name}
-            for deck_id, deck in sorted(self.player_decks.items(), key=lambda item: item[1].name.lower())
-        ]
-        return {"enemyTemplates": templates, "decks": decks, "playerDecks": player_decks}
 
     def _template_sim_stats(self, template: EnemyTemplate) -> dict:
         def range_payload(value) -> dict:
@@ -973,6 +1018,19 @@ class BattleSessionContext:
         }
 
     def template_image_url(self, template: EnemyTemplate) -> str:
+        key = (
+            getattr(template, "id", None) or "",
+            getattr(template, "image", None) or "",
+            getattr(template, "part", None) or "",
+            getattr(template, "section", None) or "",
+        )
+        url = self._template_image_urls.get(key)
+        if url is None:
+            url = self._resolve_template_image_url(template)
+            self._template_image_urls[key] = url
+        return url
+
+    def _resolve_template_image_url(self, template: EnemyTemplate) -> str:
         image = (getattr(template, "image", None) or "").replace("\\", "/").lstrip("/")
         if image.startswith("images/"):
             image = image[len("images/"):]
@@ -982,6 +1040,37 @@ class BattleSessionContext:
             image = self._derived_image_path(template) or "anonymous.png"
         return f"/images/{image}"
 
+    def entity_image_url(self, image: str, template_id: str) -> str:
+        key = (image, template_id)
+        url = self._image_url_cache.get(key)
+        if url is None:
+            url = self._resolve_entity_image_url(image, template_id)
+            self._image_url_cache[key] = url
+        return url
+
+    def _resolve_entity_image_url(self, image: str, template_id: str) -> str:
+        if image.startswith("http://") or image.startswith("https://"):
+            return image
+
+        image = image.replace("\\", "/").lstrip("/")
+        if image.startswith("images/"):
+            image = image[len("images/"):]
+        if image == "bandid.png":
+            image = "Outlaws/bandit.png"
+
+        if not image or not (self.images_dir / image).exists():
+            template = self.enemy_templates.get(template_id)
+            fallback = (getattr(template, "image", None) or "").replace("\\", "/").lstrip("/")
+            if fallback.startswith("images/"):
+                fallback = fallback[len("images/"):]
+            if fallback and (self.images_dir / fallback).exists():
+                image = fallback
+            else:
+                image = self._derived_image_path(template) if template else None
+                image = image or "anonymous.png"
+
+        return f"/images/{image}"
+
     def _derived_image_path(self, template: EnemyTemplate) -> str | None:
         part = getattr(template, "part", None) or ""
         section = getattr(template, "section", None) or ""
@@ -992,6 +1081,57 @@ class BattleSessionContext:
         derived = f"{safe(part)}/{safe(section)}/{creature_id}.png"
         return derived if (self.images_dir / derived).exists() else None
 
+    def _cached_directory_listing(self, directory: Path, build_entry) -> list[dict]:
+        # Parsing is the expensive part, so each file's entry is reused while its
+        # mtime and size are unchanged; the scandir itself is cheap. Writes made
+        # through this process also invalidate it, since mtimes are coarse.
+        previous = self._directory_listings.get(directory, {})
+        current: dict[str, tuple[tuple[int, int], Optional[dict]]] = {}
+        with os.scandir(directory) as scan:
+            for item in scan:
+                if not item.name.endswith(".json"):
+                    continue
+                stat = item.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                cached = previous.get(item.path)
+                if cached is None or cached[0] != stamp:
+                    cached = (stamp, build_entry(Path(item.path)))
+                current[item.path] = cached
+        self._directory_listings[directory] = current
+        ordered = sorted(current.values(), key=lambda cached: cached[0][0], reverse=True)
+        return [entry for _, entry in ordered if entry is not None]
+
+    def _invalidate_directory_listing(self, directory: Path) -> None:
+        self._directory_listings.pop(directory, None)
+
+    def invalidate_manual_save_listing(self) -> None:
+        self._invalidate_directory_listing(self.manual_dir)
+
+    def list_manual_save_metadata(self) -> list[dict]:
+        return self._cached_directory_listing(self.manual_dir, self.manual_save_metadata)
+
+    def manual_save_metadata(self, path: Path, payload: Optional[dict] = None) -> dict:
+        payload = payload if payload is not None else (load_save_payload(path) or {})
+        metadata = payload.get("save_slot", {}) if isinstance(payload, dict) else {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+        saved_at = payload.get("saved_at") if isinstance(payload, dict) else None
+        created_at = metadata.get("createdAt") or metadata.get("created_at") or saved_at
+        updated_at = metadata.get("updatedAt") or metadata.get("updated_at") or saved_at
+        name = str(metadata.get("name") or path.stem)
+        return {
+            "filename": path.name,
+            "name": name,
+            "label": name,
+            "createdAt": created_at,
+            "updatedAt": updated_at,
+            "savedAt": updated_at,
+        }
+
+    def flush_autosaves(self) -> None:
+        for session in list(self._sessions.values()):
+            session.flush_autosave()
+
     def create_session(self, sid: Optional[str] = None) -> "BattleSession":
         session = BattleSession(context=self, sid=sid or create_sid())
         session.dungeon = migrate_to_dungeon(session.room_columns, session.room_rows, [])
@@ -1046,10 +1186,18 @@ class BattleSession:
     undo_stack: list[dict] = field(default_factory=list)
     redo_stack: list[dict] = field(default_factory=list)
     _clean_signature: Optional[str] = field(default=None, repr=False)
+    _autosave_deferred: int = field(default=0, repr=False)
+    _autosave_pending: bool = field(default=False, repr=False)
+    _name_suffixes: Optional[dict[str, int]] = field(default=None, repr=False)
+    _autosave_digest: Optional[bytes] = field(default=None, repr=False)
+    _autosave_queued: Optional[tuple[Path, bytes, bytes]] = field(default=None, repr=False)
+    _autosave_timer: Optional[threading.Timer] = field(default=None, repr=False)
+    _autosave_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
     _rng: random.Random = field(default_factory=random.Random, repr=False)
 
     def load_from_payload(self, payload: dict, *, load_undo_stack: bool = True) -> None:
         self.state.enemies.clear()
+        self._name_suffixes = None
         self.state.grapples.clear()
         self.order = []
         self.selected_id = None
@@ -1102,7 +1250,7 @@ class BattleSession:
                 self._migrate_player_deck_state(enemy)
             else:
                 self._migrate_template_deck_state(enemy)
-            self.state.add_enemy(enemy)
+            self._add_entity(enemy)
         self.state.grapples = {grapple.id: grapple for grapple in grapples}
 
         self.order = [instance_id for instance_id in loaded_order if instance_id in self.state.enemies]
@@ -1194,7 +1342,66 @@ class BattleSession:
         self.redo_stack = []
 
     def autosave(self) -> None:
-        save_current(self.context.current_path(self.sid), self._build_payload())
+        if self._autosave_deferred:
+            self._autosave_pending = True
+            return
+        self._write_autosave()
+
+    def _write_autosave(self) -> None:
+        self._autosave_pending = False
+        path = self.context.current_path(self.sid)
+        payload = self._build_payload()
+        blob = _encode_json(payload, compact=True)
+        # saved_at changes on every build, so leave it out when deciding whether
+        # anything worth writing has changed since the last autosave. It follows
+        # the constant version/app keys, so its first occurrence is the top-level one.
+        stamp = _encode_json({"saved_at": payload["saved_at"]}, compact=True)[1:-1]
+        digest = hashlib.blake2b(blob.replace(stamp, b"", 1), digest_size=16).digest()
+        delay = self.context.autosave_delay
+        if delay <= 0:
+            if digest == self._autosave_digest and path.exists():
+                return
+            self._save_autosave_blob(path, blob, digest)
+            return
+        # Encoded bytes are immutable, so the timer thread can write them as they are.
+        with self._autosave_lock:
+            queued = self._autosave_queued
+            if queued is not None and queued[2] == digest:
+                return
+            if queued is None and digest == self._autosave_digest and path.exists():
+                return
+            self._autosave_queued = (path, blob, digest)
+            if self._autosave_timer is None:
+                self._autosave_timer = threading.Timer(delay, self.flush_autosave)
+                self._autosave_timer.daemon = True
+                self._autosave_timer.start()
+
+    def _save_autosave_blob(self, path: Path, blob: bytes, digest: bytes) -> None:
+        # Only remember the digest once the file holds it, so a failed write is retried next time.
+        self._autosave_digest = None
+        save_current_encoded(path, blob, durable=False)
+        self._autosave_digest = digest
+
+    def flush_autosave(self) -> None:
+        """Write a debounced autosave now instead of waiting for its timer."""
+        with self._autosave_lock:
+            if self._autosave_timer is not None:
+                self._autosave_timer.cancel()
+                self._autosave_timer = None
+            queued, self._autosave_queued = self._autosave_queued, None
+            if queued is not None:
+                self._save_autosave_blob(*queued)
+
+    @contextmanager
+    def coalesced_autosave(self):
+        """Collapse every autosave() issued inside the block into one write on exit."""
+        self._autosave_deferred += 1
+        try:
+            yield self
+        finally:
+            self._autosave_deferred -= 1
+            if not self._autosave_deferred and self._autosave_pending:
+                self._write_autosave()
 
     # ── Dirty / unsaved-changes tracking ──────────────────────────────────────
 
@@ -1214,8 +1421,9 @@ class BattleSession:
             return [self._scrub_for_signature(item) for item in value]
         return value
 
-    def _state_signature(self) -> str:
-        payload = self._build_payload(include_undo_stack=False)
+    def _state_signature(self, payload: Optional[dict] = None) -> str:
+        if payload is None:
+            payload = self._build_payload(include_undo_stack=False)
         scrubbed = self._scrub_for_signature(payload)
         encoded = json.dumps(scrubbed, sort_keys=True, default=str).encode("utf-8")
         return hashlib.sha256(encoded).hexdigest()
@@ -1234,14 +1442,17 @@ class BattleSession:
     def _mark_clean(self) -> None:
         self._clean_signature = self._state_signature()
 
-    def session_dirty(self) -> bool:
+    def session_dirty(self, state_payload: Optional[dict] = None) -> bool:
         if self._clean_signature is None:
             return self._has_meaningful_content()
-        return self._state_signature() != self._clean_signature
+        return self._state_signature(state_payload) != self._clean_signature
 
-    def snapshot(self) -> dict:
+    def snapshot(self, *, state_payload: Optional[dict] = None) -> dict:
+        """state_payload may pass in an undo_payload() built after the last change
+        so the dirty check does not serialize the whole session again."""
         self._ensure_selected()
-        self._cleanup_grapples(add_log=False)
+        if self._cleanup_grapples(add_log=False):
+            state_payload = None
         has_live_ordered_enemy = any(
             entity and not self.is_player(entity) and not self.is_down(entity)
             for entity in (self.state.enemies.get(instance_id) for instance_id in self.order)
@@ -1288,7 +1499,7 @@ class BattleSession:
             "dungeon": self._dungeon_snapshot(),
             "activeSave": self.active_save_snapshot(),
             "activeMapTemplate": self.active_map_template_snapshot(),
-            "sessionDirty": self.session_dirty(),
+            "sessionDirty": self.session_dirty(state_payload),
             "scenario": scenario_snapshot,
             "scenarioRun": scenario_snapshot.get("scenarioRun"),
             "pendingSearch": {
@@ -1780,10 +1991,10 @@ class BattleSession:
         self.autosave()
 
     def list_manual_saves(self) -> list[dict]:
-        entries: list[dict] = []
-        for path in sorted(self.context.manual_dir.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True):
-            entries.append(self._manual_save_entry(path))
-        return entries
+        return [
+            {**entry, "active": entry["filename"] == self.active_save_filename}
+            for entry in self.context.list_manual_save_metadata()
+        ]
 
     def active_save_snapshot(self) -> Optional[dict]:
         if not self.active_save_filename:
@@ -1822,23 +2033,9 @@ class BattleSession:
         }
 
     def _manual_save_entry(self, path: Path, payload: Optional[dict] = None) -> dict:
-        payload = payload if payload is not None else (load_save_payload(path) or {})
-        metadata = payload.get("save_slot", {}) if isinstance(payload, dict) else {}
-        if not isinstance(metadata, dict):
-            metadata = {}
-        saved_at = payload.get("saved_at") if isinstance(payload, dict) else None
-        created_at = metadata.get("createdAt") or metadata.get("created_at") or saved_at
-        updated_at = metadata.get("updatedAt") or metadata.get("updated_at") or saved_at
-        name = str(metadata.get("name") or path.stem)
-        return {
-            "filename": path.name,
-            "name": name,
-            "label": name,
-            "createdAt": created_at,
-            "updatedAt": updated_at,
-            "savedAt": updated_at,
-            "active": path.name == self.active_save_filename,
-        }
+        entry = self.context.manual_save_metadata(path, payload)
+        entry["active"] = path.name == self.active_save_filename
+        return entry
 
     def delete_manual(self, filename: str) -> None:
         path = self._manual_save_path(filename)
@@ -1848,6 +2045,7 @@ class BattleSession:
         backup = path.with_suffix(path.suffix + ".bak")
         if backup.exists() and backup.is_file():
             backup.unlink()
+        self.context.invalidate_manual_save_listing()
         if self.active_save_filename == filename:
             self.active_save_filename = None
             self.autosave()
@@ -1855,6 +2053,8 @@ class BattleSession:
     def select(self, instance_id: str) -> None:
         if instance_id not in self.state.enemies:
             raise BattleSessionError(f"Entity '{instance_id}' does not exist")
+        if self.selected_id == instance_id:
+            return
         self.selected_id = instance_id
         self.autosave()
 
@@ -1867,7 +2067,7 @@ class BattleSession:
             raise BattleSessionError(f"Template '{template.name}' is not spawnable: {blockers}")
         instance = spawn_enemy(template, self.context.decks, rnd=self._rng)
         instance.name = f"{template.name} {self._next_suffix(template.name)}"
-        self.state.add_enemy(instance)
+        self._add_entity(instance)
         self._auto_place_entity(instance)
         self.order.append(instance.instance_id)
         self.selected_id = instance.instance_id
@@ -1897,7 +2097,7 @@ class BattleSession:
             core_deck=self.context.decks[core_deck_id],
             rnd=self._rng,
         )
-        self.state.add_enemy(instance)
+        self._add_entity(instance)
         self._auto_place_entity(instance)
         self.order.append(instance.instance_id)
         self.selected_id = instance.instance_id
@@ -1940,7 +2140,7 @@ class BattleSession:
             specializations=specializations,
             rnd=self._rng,
         )
-        self.state.add_enemy(instance)
+        self._add_entity(instance)
         self._auto_place_entity(instance)
         self.order.append(instance.instance_id)
         self.selected_id = instance.instance_id
@@ -1989,7 +2189,7 @@ class BattleSession:
             "specializations": list(getattr(instance, "specializations", []) or []),
         }
         instance.card_library = card_library_from_profile(profile)
-        self.state.add_enemy(instance)
+        self._add_entity(instance)
         self._auto_place_entity(instance)
         self.order.append(instance.instance_id)
         self.selected_id = instance.instance_id
@@ -2011,7 +2211,7 @@ class BattleSession:
             or instance_id in set(self.pending_opportunity.get("attacker_ids", []) or [])
         ):
             self.pending_opportunity = None
-        self.state.remove_enemy(instance_id)
+        self._remove_entity(instance_id)
         if instance_id in self.order:
             self.order.remove(instance_id)
         if self.selected_id == instance_id:
@@ -2021,11 +2221,11 @@ class BattleSession:
         self.autosave()
 
     def move_in_order(self, instance_id: str, direction: int) -> None:
-        if instance_id not in self.order:
+        index = self._order_position(instance_id)
+        if index is None:
             raise BattleSessionError(f"Entity '{instance_id}' is not in round order")
         if direction not in (-1, 1):
             raise BattleSessionError("direction must be -1 or 1")
-        index = self.order.index(instance_id)
         new_index = index + direction
         if new_index < 0 or new_index >= len(self.order):
             return
@@ -2250,9 +2450,9 @@ class BattleSession:
         self.autosave()
 
     def _normalize_info_marker_payload(self, raw: dict, *, existing_id: Optional[str] = None) -> dict:
-        marker_id = str(raw.get("id") or existing_id or f"info_{uuid.uuid4().hex[:8]}").strip()
+        marker_id = str(raw.get("id") or existing_id or f"info_{secrets.token_hex(4)}").strip()
         if not marker_id:
-            marker_id = f"info_{uuid.uuid4().hex[:8]}"
+            marker_id = f"info_{secrets.token_hex(4)}"
         try:
             x = int(raw.get("x"))
             y = int(raw.get("y"))
@@ -2575,9 +2775,9 @@ class BattleSession:
             if not isinstance(raw, dict):
                 continue
             data = dict(raw)
-            data["instance_id"] = f"unit_{uuid.uuid4().hex[:8]}"
+            data["instance_id"] = f"unit_{secrets.token_hex(4)}"
             enemy = enemy_from_dict(data)
-            self.state.add_enemy(enemy)
+            self._add_entity(enemy)
             self.order.append(enemy.instance_id)
             new_ids.append(enemy.instance_id)
         return new_ids
@@ -2592,7 +2792,7 @@ class BattleSession:
             if entity is not None and self.active_turn_id == instance_id:
                 self.active_turn_id = None
                 self.turn_in_progress = False
-            self.state.remove_enemy(instance_id)
+            self._remove_entity(instance_id)
             if instance_id in self.order:
                 self.order.remove(instance_id)
             if self.selected_id == instance_id:
@@ -2816,15 +3016,17 @@ class BattleSession:
         if not self.dungeon or not self.dungeon.pending_encounter_room_ids:
             return []
         added_ids: list[str] = []
+        ordered_ids = set(self.order)
         for room_id in list(self.dungeon.pending_encounter_room_ids):
             for entity in self.state.enemies.values():
                 if (
                     entity.room_id == room_id
                     and not self.is_player(entity)
                     and not self.is_down(entity)
-                    and entity.instance_id not in self.order
+                    and entity.instance_id not in ordered_ids
                 ):
                     self.order.append(entity.instance_id)
+                    ordered_ids.add(entity.instance_id)
                     added_ids.append(entity.instance_id)
         self.dungeon.pending_encounter_room_ids.clear()
         return added_ids
@@ -4026,9 +4228,10 @@ class BattleSession:
             raise BattleSessionError(f"No free adjacent position found for {source.name}")
 
         self._set_position(instance, position[0], position[1])
-        self.state.add_enemy(instance)
-        if source.instance_id in self.order:
-            self.order.insert(self.order.index(source.instance_id) + 1, instance.instance_id)
+        self._add_entity(instance)
+        source_index = self._order_position(source.instance_id)
+        if source_index is not None:
+            self.order.insert(source_index + 1, instance.instance_id)
         else:
             self.order.append(instance.instance_id)
         self.selected_id = instance.instance_id
@@ -4542,7 +4745,8 @@ class BattleSession:
         deck_state = entity.deck_state
         drawn: list[str] = []
         reshuffled = False
-        for _ in range(max(0, int(count))):
+        remaining = max(0, int(count))
+        while remaining > 0:
             if not deck_state.draw_pile and deck_state.discard_pile:
                 deck_state.draw_pile = list(deck_state.discard_pile)
                 deck_state.discard_pile.clear()
@@ -4550,7 +4754,10 @@ class BattleSession:
                 reshuffled = True
             if not deck_state.draw_pile:
                 break
-            drawn.append(deck_state.draw_pile.pop(0))
+            chunk = deck_state.draw_pile[:remaining]
+            del deck_state.draw_pile[:remaining]
+            drawn.extend(chunk)
+            remaining -= len(chunk)
         if drawn:
             deck_state.discard_pile.extend(drawn)
         return drawn, reshuffled
@@ -5809,6 +6016,7 @@ class BattleSession:
         if "name" in identity:
             name = str(identity.get("name") or "").strip()
             entity.name = name or "Unit"
+            self._name_suffixes = None
         if "image" in identity:
             entity.image = self._normalize_unit_image_value(identity.get("image"))
 
@@ -6347,12 +6555,7 @@ class BattleSession:
             raise BattleSessionError(f"Missing template for '{entity.name}'")
         if not getattr(template, "loot", ()):
             raise BattleSessionError(f"{template.name} has no loot table.")
-        loot_result = roll_loot(template, rnd=self._rng)
-        entity.rolled_loot = {
-            "currency": dict(loot_result.currency),
-            "resources": dict(loot_result.resources),
-            "other": list(loot_result.other),
-        }
+        entity.rolled_loot = roll_loot_payload(template, rnd=self._rng)
         entity.loot_rolled = True
         if add_log:
             self._add_log(f"Loot inspected for {entity.name}")
@@ -6408,6 +6611,7 @@ class BattleSession:
             "updatedAt": saved_at,
         }
         save_current(path, payload)
+        self.context.invalidate_manual_save_listing()
         self._add_log(f"Session save created: {display_name}")
         self._mark_clean()
         self.autosave()
@@ -6429,6 +6633,7 @@ class BattleSession:
             "updatedAt": saved_at,
         }
         save_current(path, payload)
+        self.context.invalidate_manual_save_listing()
         self._add_log(f"Session save updated: {previous_entry['name']}")
         self._mark_clean()
         self.autosave()
@@ -6466,28 +6671,10 @@ class BattleSession:
         return path
 
     def image_url_for(self, entity: EnemyInstance) -> str:
-        image = getattr(entity, "image", None) or ""
-        if image.startswith("http://") or image.startswith("https://"):
-            return image
-
-        image = image.replace("\\", "/").lstrip("/")
-        if image.startswith("images/"):
-            image = image[len("images/"):]
-        if image == "bandid.png":
-            image = "Outlaws/bandit.png"
-
-        if not image or not (self.context.images_dir / image).exists():
-            template = self.context.enemy_templates.get(getattr(entity, "template_id", ""))
-            fallback = (getattr(template, "image", None) or "").replace("\\", "/").lstrip("/")
-            if fallback.startswith("images/"):
-                fallback = fallback[len("images/"):]
-            if fallback and (self.context.images_dir / fallback).exists():
-                image = fallback
-            else:
-                image = self.context._derived_image_path(template) if template else None
-                image = image or "anonymous.png"
-
-        return f"/images/{image}"
+        return self.context.entity_image_url(
+            getattr(entity, "image", None) or "",
+            getattr(entity, "template_id", "") or "",
+        )
 
     def effective_movement(self, entity: EnemyInstance) -> int:
         if "slowed" in getattr(entity, "statuses", {}):
@@ -6667,20 +6854,29 @@ class BattleSession:
     def format_statuses(self, statuses: dict) -> str:
         if not statuses:
             return "—"
-        parts: list[str] = []
-        for key, value in statuses.items():
-            if isinstance(value, dict) and "stacks" in value:
-                parts.append(f"{key}({value.get('stacks')})")
-            else:
-                parts.append(key)
-        return ", ".join(parts)
+        return ", ".join(
+            f"{key}({value['stacks']})" if isinstance(value, dict) and "stacks" in value else key
+            for key, value in statuses.items()
+        )
 
     def card_to_effect_text(self, card_id: str) -> str:
         if card_id == WOUND_CARD_ID:
             return "Wound"
+        text_cache = self.context._card_text_cache
+        cached = text_cache.get(card_id)
+        if cached is not None:
+            return cached
         card = self._card_for_id(card_id)
         if not card:
             return card_id
+        text = self._card_effect_text(card, card_id)
+        # Only context decks are immutable between template reloads; per-entity
+        # card libraries can be edited, so their text is rebuilt every time.
+        if self.context.card_index.get(card_id) is card:
+            text_cache[card_id] = text
+        return text
+
+    def _card_effect_text(self, card: Card, card_id: str) -> str:
         if card.action_text:
             return card.action_text
         if self._has_player_card_metadata(card):
@@ -7157,7 +7353,7 @@ class BattleSession:
             entity.is_ko = False
 
     def visible_draw_for(self, entity: EnemyInstance) -> list[str]:
-        return list(getattr(entity, "visible_draw", []))
+        return list(entity.visible_draw)
 
     def visible_draw_groups_for(self, entity: EnemyInstance) -> list[list[str]]:
         groups = [
@@ -7397,19 +7593,12 @@ class BattleSession:
         )
 
     def _guard_from_draw(self, card_ids: list[str]) -> int:
-        guard_total = 0
-        for card_id in card_ids:
-            card = self.context.card_index.get(card_id)
-            if not card:
-                continue
-            for effect in card.effects:
-                if effect.type == "guard":
-                    guard_total += int(effect.amount)
-        return guard_total
+        guard_by_card_id = self.context.guard_by_card_id
+        return sum(guard_by_card_id.get(card_id, 0) for card_id in card_ids)
 
     def _discard_current_draw(self, entity: EnemyInstance) -> None:
         deck_state = entity.deck_state
-        previous_guard = self._guard_from_draw(list(deck_state.hand))
+        previous_guard = self._guard_from_draw(deck_state.hand)
         if previous_guard:
             extra_guard = max(0, entity.guard_current - int(getattr(entity, "guard_base", 0)))
             entity.guard_current = max(0, entity.guard_current - min(previous_guard, extra_guard))
@@ -7715,14 +7904,16 @@ class BattleSession:
 
     def _ordered_enemy_ids(self) -> list[str]:
         ordered = [instance_id for instance_id in self.order if instance_id in self.state.enemies]
-        unordered = [instance_id for instance_id in self.state.enemies.keys() if instance_id not in ordered]
+        ordered_ids = set(ordered)
+        unordered = [instance_id for instance_id in self.state.enemies.keys() if instance_id not in ordered_ids]
         return ordered + unordered
 
     def _serialize_enemy(self, instance_id: str) -> dict:
         entity = self.state.enemies[instance_id]
+        is_player = self.is_player(entity)
         grappled_by = [self._grapple_payload(grapple) for grapple in self._grapples_for_target(instance_id)]
         grappling = [self._grapple_payload(grapple) for grapple in self._grapples_by_grappler(instance_id)]
-        derived_statuses = dict(getattr(entity, "statuses", {}) or {})
+        derived_statuses = dict(entity.statuses or {})
         if grappled_by:
             derived_statuses["grappled"] = {"stacks": len(grappled_by)}
         if grappling:
@@ -7731,15 +7922,17 @@ class BattleSession:
             {
                 "label": f"Draw {index + 1}",
                 "items": [self.card_to_effect_text(card_id) for card_id in group],
-                "summary": self._player_draw_summary(group) if self.is_player(entity) else None,
+                "summary": self._player_draw_summary(group) if is_player else None,
             }
             for index, group in enumerate(self.visible_draw_groups_for(entity))
         ]
-        loot_taken_by = getattr(entity, "loot_taken_by", None)
+        visible_draw = self.visible_draw_for(entity)
+        has_loot = self._has_template_loot(entity)
+        loot_taken_by = entity.loot_taken_by
         loot_state = (
             "taken" if loot_taken_by
-            else "inspected" if getattr(entity, "loot_rolled", False)
-            else "uninspected" if self._has_template_loot(entity)
+            else "inspected" if entity.loot_rolled
+            else "uninspected" if has_loot
             else "none"
         )
         loot_taker = self.state.enemies.get(loot_taken_by) if loot_taken_by else None
@@ -7747,44 +7940,40 @@ class BattleSession:
         payload.update(
             {
                 "image_url": self.image_url_for(entity),
-                "is_player": self.is_player(entity),
+                "is_player": is_player,
                 "is_down": self.is_down(entity),
-                "is_ko": bool(getattr(entity, "is_ko", False)) if self.is_player(entity) else False,
-                "has_loot": self._has_template_loot(entity),
+                "is_ko": bool(entity.is_ko) if is_player else False,
+                "has_loot": has_loot,
                 "loot_state": loot_state,
                 "loot_taken_by_name": loot_taker.name if loot_taker else None,
-                "inventory": normalize_loot_payload(getattr(entity, "inventory", None)),
-                "rolled_loot": normalize_loot_payload(getattr(entity, "rolled_loot", None)),
+                "inventory": normalize_loot_payload(entity.inventory),
+                "rolled_loot": normalize_loot_payload(entity.rolled_loot),
                 "template_info": self._template_info_for(entity),
-                "quick_attack_used": bool(getattr(entity, "quick_attack_used", False)),
+                "quick_attack_used": bool(entity.quick_attack_used),
                 "effective_movement": self.effective_movement(entity),
                 "statuses": derived_statuses,
                 "status_text": self.format_statuses(derived_statuses),
-                "abilities": _normalize_unit_abilities(getattr(entity, "abilities", {})),
-                "specializations": _normalize_unit_specializations(getattr(entity, "specializations", [])),
+                "abilities": _normalize_unit_abilities(entity.abilities),
+                "specializations": _normalize_unit_specializations(entity.specializations),
                 "grappled_by": grappled_by,
                 "grappling": grappling,
                 "current_draw_groups": draw_groups,
-                "current_draw_text": [self.card_to_effect_text(card_id) for card_id in self.visible_draw_for(entity)],
-                "current_draw_summary": (
-                    self._player_draw_summary(self.visible_draw_for(entity))
-                    if self.is_player(entity)
-                    else None
-                ),
-                "pending_reshuffle": bool(getattr(entity, "pending_reshuffle", False)),
-                "draw_bonus_pending": int(getattr(entity, "draw_bonus_pending", 0)),
-                "draw_bonus_next_turn": int(getattr(entity, "draw_bonus_next_turn", 0)),
-                "actions_used": int(getattr(entity, "actions_used", 0)),
-                "physical_cards": bool(getattr(entity, "physical_cards", False)) if self.is_player(entity) else False,
-                "physical_wounds": max(0, int(getattr(entity, "physical_wounds", 0) or 0)) if self.is_player(entity) else 0,
-                "opportunity_attack_used_round": int(getattr(entity, "opportunity_attack_used_round", 0) or 0),
-                "melee_weapon": dict(getattr(entity, "melee_weapon", {}) or {}) if self.is_player(entity) else None,
-                "opportunity_base_damage": self._opportunity_base_damage(entity) if self.is_player(entity) else 1,
+                "current_draw_text": [self.card_to_effect_text(card_id) for card_id in visible_draw],
+                "current_draw_summary": self._player_draw_summary(visible_draw) if is_player else None,
+                "pending_reshuffle": bool(entity.pending_reshuffle),
+                "draw_bonus_pending": int(entity.draw_bonus_pending),
+                "draw_bonus_next_turn": int(entity.draw_bonus_next_turn),
+                "actions_used": int(entity.actions_used),
+                "physical_cards": bool(entity.physical_cards) if is_player else False,
+                "physical_wounds": max(0, int(entity.physical_wounds or 0)) if is_player else 0,
+                "opportunity_attack_used_round": int(entity.opportunity_attack_used_round or 0),
+                "melee_weapon": dict(entity.melee_weapon or {}) if is_player else None,
+                "opportunity_base_damage": self._opportunity_base_damage(entity) if is_player else 1,
                 "opportunity_reach": self._opportunity_reach(entity),
-                "wounds_in_hand": 0 if self._uses_physical_cards(entity) else entity.deck_state.hand.count(WOUND_CARD_ID) if self.is_player(entity) else 0,
-                "power_draw_used": bool(getattr(entity, "power_draw_used", False)),
-                "wound_counts": self._player_wound_counts(entity) if self.is_player(entity) else None,
-                "power_draw_cards": self._power_draw_cards_payload(entity) if self.is_player(entity) else None,
+                "wounds_in_hand": 0 if self._uses_physical_cards(entity) else entity.deck_state.hand.count(WOUND_CARD_ID) if is_player else 0,
+                "power_draw_used": bool(entity.power_draw_used),
+                "wound_counts": self._player_wound_counts(entity) if is_player else None,
+                "power_draw_cards": self._power_draw_cards_payload(entity) if is_player else None,
                 "editor": self._unit_editor_payload(entity),
                 "current_draw_attacks": [
                     self._quick_attack_payload(step)
@@ -7887,9 +8076,7 @@ class BattleSession:
         if core_deck is None:
             return
 
-        expected_core_ids: list[str] = []
-        for card in core_deck.cards:
-            expected_core_ids.extend([card.id] * card.weight)
+        expected_core_ids = core_deck.weighted_card_ids
         expected_special_counts = Counter()
         for special in template.specials:
             expected_special_counts.update({special.id: special.weight})
@@ -7928,7 +8115,7 @@ class BattleSession:
         deck_state.hand = new_hand
         deck_state.discard_pile = new_discard
         deck_state.draw_pile = new_draw
-        if getattr(entity, "visible_draw", []) or new_hand:
+        if entity.visible_draw or new_hand:
             self._set_visible_draw(entity, new_hand)
 
     def _ensure_selected(self) -> None:
@@ -7941,8 +8128,12 @@ class BattleSession:
         if not self.order:
             self.selected_id = None
             return False
-        anchor_id = current_id if current_id in self.order else self.selected_id
-        if anchor_id not in self.order:
+        anchor_id = current_id
+        current_index = self._order_position(current_id)
+        if current_index is None:
+            anchor_id = self.selected_id
+            current_index = self._order_position(anchor_id)
+        if current_index is None:
             for instance_id in self.order:
                 entity = self.state.enemies.get(instance_id)
                 if entity and self._can_take_turn(entity):
@@ -7950,7 +8141,6 @@ class BattleSession:
                     return False
             self.selected_id = self.order[0]
             return False
-        current_index = self.order.index(anchor_id)
         for offset in range(1, len(self.order) + 1):
             next_index = (current_index + offset) % len(self.order)
             instance_id = self.order[next_index]
@@ -7963,15 +8153,37 @@ class BattleSession:
         self.selected_id = anchor_id if anchor_id in self.state.enemies else self.order[0]
         return False
 
+    def _order_position(self, instance_id: Optional[str]) -> Optional[int]:
+        if instance_id is None:
+            return None
+        try:
+            return self.order.index(instance_id)
+        except ValueError:
+            return None
+
+    def _add_entity(self, entity: EnemyInstance) -> None:
+        self.state.add_enemy(entity)
+        if self._name_suffixes is not None:
+            self._record_name_suffix(self._name_suffixes, entity.name)
+
+    def _remove_entity(self, instance_id: str) -> None:
+        self.state.remove_enemy(instance_id)
+        self._name_suffixes = None
+
+    @staticmethod
+    def _record_name_suffix(suffixes: dict[str, int], name: str) -> None:
+        suffixes[name] = max(suffixes.get(name, 0), 1)
+        parts = name.rsplit(" ", 1)
+        if len(parts) == 2 and parts[1].isdigit():
+            suffixes[parts[0]] = max(suffixes.get(parts[0], 0), int(parts[1]))
+
     def _next_suffix(self, base_name: str) -> int:
-        max_found = 0
-        for entity in self.state.enemies.values():
-            parts = entity.name.rsplit(" ", 1)
-            if len(parts) == 2 and parts[0] == base_name and parts[1].isdigit():
-                max_found = max(max_found, int(parts[1]))
-            elif entity.name == base_name:
-                max_found = max(max_found, 1)
-        return max_found + 1
+        if self._name_suffixes is None:
+            suffixes: dict[str, int] = {}
+            for entity in self.state.enemies.values():
+                self._record_name_suffix(suffixes, entity.name)
+            self._name_suffixes = suffixes
+        return self._name_suffixes.get(base_name, 0) + 1
 
     def _require_selected_enemy(self) -> EnemyInstance:
         entity = self._require_selected_entity()
@@ -9,7 +9,7 @@ AttackMod = str
 WOUND_CARD_ID = "wound"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CombatLog:
     instance_id: str
     action: str
@@ -94,10 +94,36 @@ def apply_attack(
     if damage < 0:
         raise ValueError("damage must be >= 0")
 
-    raw_mods = [_normalise_attack_mod(str(mod)) for mod in (mods or []) if str(mod).strip()]
-    mods_set = set(raw_mods)
-    pierce_amount = _sum_modifier_amount(raw_mods, "pierce")
-    sunder_amount = _sum_modifier_amount(raw_mods, "sunder", default_for_bare=1)
+    if damage == 0 and not mods and enemy.armor_current >= 0 and enemy.magic_armor_current >= 0:
+        # Nothing can change except clamping negative pools, as the full path would.
+        # (Negative armor turns zero damage into positive damage, so it takes the full path.)
+        toughness_b = enemy.toughness_current
+        guard_b = enemy.guard_current
+        if toughness_b < 0:
+            enemy.toughness_current = 0
+        if guard_b < 0:
+            enemy.guard_current = 0
+        return CombatLog(
+            instance_id=enemy.instance_id,
+            action="attack",
+            toughness_before=toughness_b,
+            toughness_after=enemy.toughness_current,
+            guard_before=guard_b,
+            guard_after=enemy.guard_current,
+            armor_before=enemy.armor_current,
+            armor_after=enemy.armor_current,
+            magic_armor_before=enemy.magic_armor_current,
+            magic_armor_after=enemy.magic_armor_current,
+        )
+
+    if mods:
+        raw_mods = [_normalise_attack_mod(str(mod)) for mod in mods if str(mod).strip()]
+        mods_set = set(raw_mods)
+        pierce_amount = _sum_modifier_amount(raw_mods, "pierce")
+        sunder_amount = _sum_modifier_amount(raw_mods, "sunder", default_for_bare=1)
+    else:
+        mods_set = frozenset()
+        pierce_amount = sunder_amount = 0
 
     toughness_b = enemy.toughness_current
     guard_b = enemy.guard_current
@@ -105,9 +131,12 @@ def apply_attack(
     magic_b = enemy.magic_armor_current
 
     # 1) destructive modifiers happen before temporary bypass modifiers.
-    guard_removed = min(guard_b, sunder_amount * 2)
-    guard_now = max(0, guard_b - guard_removed)
-    armor_now = max(0, armor_b - 1) if "shatter" in mods_set else armor_b
+    # Clamps below are plain comparisons rather than max()/min() calls; guard_now is never negative.
+    sunder_guard = sunder_amount * 2
+    guard_now = guard_b - sunder_guard if guard_b > sunder_guard else 0
+    armor_now = armor_b
+    if "shatter" in mods_set:
+        armor_now = armor_b - 1 if armor_b > 0 else 0
     magic_now = magic_b
 
     # 2) compute ignores (bypass reductions; do NOT destroy them)
@@ -123,16 +152,24 @@ def apply_attack(
         armor_eff = 0
     else:
         if pierce_amount > 0:
-            ignored_armor = min(pierce_amount, armor_eff)
-            armor_eff = max(0, armor_eff - ignored_armor)
-            ignored_guard = min(max(0, pierce_amount - ignored_armor), guard_eff)
-            guard_eff = max(0, guard_eff - ignored_guard)
+            if armor_eff > pierce_amount:
+                ignored_armor = pierce_amount
+                armor_eff -= pierce_amount
+            else:
+                ignored_armor = armor_eff
+                armor_eff = 0
+            remaining_pierce = pierce_amount - ignored_armor
+            ignored_guard = remaining_pierce if remaining_pierce < guard_eff else guard_eff
+            guard_eff -= ignored_guard
             ignored_regular += ignored_armor + ignored_guard
 
         if "stab" in mods_set:
-            stab_ignore = min(1, armor_eff)
-            armor_eff = max(0, armor_eff - stab_ignore)
-            ignored_regular += stab_ignore
+            if armor_eff > 0:
+                armor_eff -= 1
+                ignored_regular += 1
+            else:
+                ignored_regular += armor_eff
+                armor_eff = 0
 
         if "overwhelm" in mods_set:
             ignored_regular += guard_eff
@@ -141,14 +178,18 @@ def apply_attack(
     if "magic_pierce" in mods_set:
         ignored_magic = magic_now
 
-    magic_eff = max(0, magic_now - ignored_magic)
+    magic_eff = magic_now - ignored_magic
+    if magic_eff < 0:
+        magic_eff = 0
 
     # 3) compute damage & consume guard as a pool
-    damage_after_fixed = max(0, damage - (armor_eff + magic_eff))
-    guard_used = min(guard_eff, damage_after_fixed)
+    damage_after_fixed = damage - (armor_eff + magic_eff)
+    if damage_after_fixed < 0:
+        damage_after_fixed = 0
+    guard_used = guard_eff if guard_eff < damage_after_fixed else damage_after_fixed
     dmg_to_hp = damage_after_fixed - guard_used
 
-    guard_after = max(0, guard_now - guard_used)
+    guard_after = guard_now - guard_used
 
     # 4) apply
     wounds_added = 0
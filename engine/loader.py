@@ -1,9 +1,19 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import pickle
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json accepts the same bytes
+    from json import loads as _json_loads
+
+from engine import models
 from engine.models import (
     Deck, Card, Effect, RangeInt,
     EnemyTemplate, RandomBoolSpec, LootEntry
@@ -11,7 +21,7 @@ from engine.models import (
 
 
 def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _json_loads(path.read_bytes())
 
 
 def _parse_range(obj: dict, path: str) -> RangeInt:
@@ -19,14 +29,15 @@ def _parse_range(obj: dict, path: str) -> RangeInt:
 
 
 def _parse_effect(obj: dict) -> Effect:
-    mods = tuple(obj.get("modifiers", []))
-    return Effect(type=obj["type"], amount=int(obj.get("amount", 0)), modifiers=mods)
+    # Effect types and modifiers are compared against literals in combat code; interning makes those identity hits.
+    mods = tuple([sys.intern(str(mod)) for mod in obj.get("modifiers", [])])
+    return Effect(type=sys.intern(obj["type"]), amount=int(obj.get("amount", 0)), modifiers=mods)
 
 
 def _parse_card(obj: dict) -> Card:
-    effects = tuple(_parse_effect(e) for e in obj.get("effects", []))
+    effects = tuple([_parse_effect(e) for e in obj.get("effects", [])])
     return Card(
-        id=obj["id"],
+        id=sys.intern(obj["id"]),
         title=obj.get("title", obj["id"]),
         effects=effects,
         weight=int(obj.get("weight", 1)),
@@ -72,9 +83,10 @@ def _validate_enemy_image_category(enemy: EnemyTemplate, path: Path) -> list[str
 def _parse_loot(entries: list[dict]) -> tuple[LootEntry, ...]:
     loot: list[LootEntry] = []
     for e in entries:
+        kind = e.get("kind")
         loot.append(LootEntry(
-            type=e["type"],
-            kind=e.get("kind"),
+            type=sys.intern(e["type"]),
+            kind=sys.intern(kind) if isinstance(kind, str) else kind,
             min=e.get("min"),
             max=e.get("max"),
             text=e.get("text"),
@@ -82,14 +94,79 @@ def _parse_loot(entries: list[dict]) -> tuple[LootEntry, ...]:
     return tuple(loot)
 
 
-def load_decks(decks_dir: Path) -> dict[str, Deck]:
+@lru_cache(maxsize=1)
+def _model_fingerprint() -> str:
+    # Pickled decks are only as good as the classes and parser that built them,
+    # so any edit to either module invalidates the sidecar.
+    digest = hashlib.blake2b(digest_size=16)
+    for source in (models.__file__, __file__):
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()
+
+
+def _source_signature(paths: list[Path]) -> tuple:
+    signature = []
+    for p in paths:
+        stat = p.stat()
+        signature.append((p.name, stat.st_mtime_ns, stat.st_size))
+    return (_model_fingerprint(), tuple(signature))
+
+
+def _read_deck_cache(cache_path: Path, signature: tuple) -> dict[str, Deck] | None:
+    # Anything unexpected in the sidecar is a miss; the decks are simply parsed again.
+    try:
+        with cache_path.open("rb") as f:
+            cached_signature, decks = pickle.load(f)
+        if cached_signature != signature or not isinstance(decks, dict) or not decks:
+            return None
+        if not all(isinstance(deck, Deck) for deck in decks.values()):
+            return None
+        _intern_deck_strings(decks)
+    except Exception:
+        return None
+    return decks
+
+
+def _intern_deck_strings(decks: dict[str, Deck]) -> None:
+    # Unpickled strings are plain copies; redo the interning _parse_card/_parse_effect apply.
+    intern = sys.intern
+    set_frozen = object.__setattr__
+    for deck in decks.values():
+        for card in deck.cards:
+            set_frozen(card, "id", intern(card.id))
+            for effect in card.effects:
+                set_frozen(effect, "type", intern(effect.type))
+                if effect.modifiers:
+                    set_frozen(effect, "modifiers", tuple([intern(mod) for mod in effect.modifiers]))
+
+
+def _write_deck_cache(cache_path: Path, signature: tuple, decks: dict[str, Deck]) -> None:
+    tmp = cache_path.with_suffix(cache_path.suffix + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump((signature, decks), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        # The cache is only an optimisation; a read-only saves dir just means parsing every start.
+        tmp.unlink(missing_ok=True)
+
+
+def load_decks(decks_dir: Path, *, cache_path: Path | None = None) -> dict[str, Deck]:
+    paths = sorted(decks_dir.glob("*.json"))
+    signature = _source_signature(paths) if cache_path is not None else None
+    if cache_path is not None:
+        cached = _read_deck_cache(cache_path, signature)
+        if cached is not None:
+            return cached
+
     decks: dict[str, Deck] = {}
-    for p in sorted(decks_dir.glob("*.json")):
+    for p in paths:
         raw = _read_json(p)
         deck = Deck(
             id=raw["id"],
             name=raw.get("name", raw["id"]),
-            cards=tuple(_parse_card(c) for c in raw["cards"]),
+            cards=tuple([_parse_card(c) for c in raw["cards"]]),
         )
         errs = deck.validate(f"Deck({p.name})")
         if errs:
@@ -100,6 +177,8 @@ def load_decks(decks_dir: Path) -> dict[str, Deck]:
 
     if not decks:
         raise ValueError(f"No deck json files found in {decks_dir}")
+    if cache_path is not None:
+        _write_deck_cache(cache_path, signature, decks)
     return decks
 
 
@@ -128,7 +207,7 @@ def load_enemies(enemies_dir: Path, decks: dict[str, Deck], images_dir: Path) ->
             movement=int(raw.get("movement", 0)),
             initiative_modifier=int(raw.get("initiativeModifier", 2)),
             coreDeck=raw["coreDeck"],
-            specials=tuple(_parse_card(c) for c in raw["specials"]),
+            specials=tuple([_parse_card(c) for c in raw["specials"]]),
 
             loot=_parse_loot(raw.get("loot", [])),
         )
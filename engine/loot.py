@@ -13,32 +13,41 @@ class LootRoll:
     other: tuple[str, ...] = ()                              # free text lines
 
 
-def _roll_range(mn: int, mx: int, rnd: random.Random) -> int:
-    return rnd.randint(mn, mx)
+def roll_loot(template: EnemyTemplate, *, rnd: Optional[random.Random] = None) -> LootRoll:
+    cur, res, other = _roll_loot_totals(template, rnd or random)
+    return LootRoll(currency=cur, resources=res, other=tuple(other))
 
 
-def roll_loot(template: EnemyTemplate, *, rnd: Optional[random.Random] = None) -> LootRoll:
-    rnd = rnd or random
+def roll_loot_payload(template: EnemyTemplate, *, rnd: Optional[random.Random] = None) -> dict:
+    """Roll loot straight into the mutable rolled_loot payload kept on an enemy."""
+    cur, res, other = _roll_loot_totals(template, rnd or random)
+    return {"currency": cur, "resources": res, "other": other}
 
+
+def _roll_loot_totals(template: EnemyTemplate, rnd: random.Random) -> tuple[dict[str, int], dict[str, int], list[str]]:
     cur: dict[str, int] = {}
     res: dict[str, int] = {}
     other: list[str] = []
 
-    for i, entry in enumerate(template.loot):
-        if entry.type in ("currency", "resource"):
-            if entry.min is None or entry.max is None or entry.kind is None:
+    randrange = rnd.randrange
+    for entry in template.loot:
+        entry_type = entry.type
+        if entry_type == "currency" or entry_type == "resource":
+            kind = entry.kind
+            if entry.min is None or entry.max is None or kind is None:
                 # should never happen due to validation
                 continue
-            amount = _roll_range(int(entry.min), int(entry.max), rnd)
+            # randrange(a, b + 1) draws exactly what randint(a, b) did, minus a call frame. Fixed ranges
+            # still roll so seeded loot stays reproducible.
+            amount = randrange(int(entry.min), int(entry.max) + 1)
             if amount <= 0:
                 continue
-            if entry.type == "currency":
-                cur[entry.kind] = cur.get(entry.kind, 0) + amount
-            else:
-                res[entry.kind] = res.get(entry.kind, 0) + amount
+            totals = cur if entry_type == "currency" else res
+            totals[kind] = totals.get(kind, 0) + amount
 
-        elif entry.type == "other":
-            if entry.text and entry.text.strip():
-                other.append(entry.text.strip())
+        elif entry_type == "other":
+            text = entry.text.strip() if entry.text else ""
+            if text:
+                other.append(text)
 
-    return LootRoll(currency=cur, resources=res, other=tuple(other))
+    return cur, res, other
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import chain, repeat
 from typing import Literal, Optional
 
 # --- Enums / literals ---
@@ -97,6 +99,11 @@ class Deck:
     name: str
     cards: tuple[Card, ...]
 
+    @cached_property
+    def weighted_card_ids(self) -> tuple[str, ...]:
+        """Card ids repeated by weight, in deck order (unshuffled)."""
+        return tuple(chain.from_iterable(repeat(card.id, card.weight) for card in self.cards))
+
     def validate(self, path: str) -> list[str]:
         errs: list[str] = []
         if not self.id:
@@ -210,6 +217,11 @@ class EnemyTemplate:
     spawn_blockers: tuple[str, ...] = ()
     image_missing: bool = False
 
+    @cached_property
+    def special_card_ids(self) -> tuple[str, ...]:
+        """Special card ids repeated by weight, built once per template."""
+        return tuple(chain.from_iterable(repeat(special.id, special.weight) for special in self.specials))
+
     def validate(self, path: str, available_decks: set[str]) -> list[str]:
         errs: list[str] = []
         if not self.id:
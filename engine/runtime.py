@@ -2,12 +2,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional
 import random
-import uuid
+import secrets
 
-from engine.models import Deck, EnemyTemplate, Card
+from engine.models import Deck, EnemyTemplate
 from engine.runtime_models import EnemyInstance, DeckState, GrappleInstance
 from engine.turn_hooks import on_turn_start, on_turn_end
-from engine.loot import roll_loot
+from engine.loot import roll_loot_payload
 
 
 # --- helpers (stap 1) ---
@@ -18,18 +18,14 @@ def roll_range(rng, *, rnd: random.Random) -> int:
 def roll_random_bool(*, rnd: random.Random) -> bool:
     return bool(rnd.getrandbits(1))
 
-def build_deck_card_ids(core_deck: Deck, specials: tuple[Card, ...]) -> list[str]:
-    ids: list[str] = []
-    for c in core_deck.cards:
-        ids.extend([c.id] * c.weight)
-    for s in specials:
-        ids.extend([s.id] * s.weight)
+def build_deck_card_ids(core_deck: Deck, special_card_ids: tuple[str, ...]) -> list[str]:
+    ids = [*core_deck.weighted_card_ids, *special_card_ids]
     if not ids:
         raise ValueError("Built deck is empty (core + specials).")
     return ids
 
 def uuid4_short() -> str:
-    return uuid.uuid4().hex[:10]
+    return secrets.token_hex(5)
 
 
 # --- spawning (stap 1) ---
@@ -51,7 +47,7 @@ def spawn_enemy(
     base_guard = roll_range(template.baseGuard, rnd=rnd)
 
     core_deck = template.action_deck or decks[template.coreDeck]
-    card_ids = build_deck_card_ids(core_deck, template.specials)
+    card_ids = build_deck_card_ids(core_deck, template.special_card_ids)
     rnd.shuffle(card_ids)
 
     return EnemyInstance(
@@ -118,14 +114,18 @@ def _draw_into_hand(enemy: EnemyInstance, n: int, *, rnd: random.Random) -> tupl
     drawn_now: list[str] = []
     reshuffled_any = False
 
-    for _ in range(n):
-        # ensure we have something to draw
+    remaining = n
+    while remaining > 0:
+        # ensure we have something to draw; at most one reshuffle per draw is ever needed
         reshuffled_any = _reshuffle_if_needed(ds, rnd=rnd) or reshuffled_any
         if not ds.draw_pile:
             break  # nothing left anywhere
-        card_id = ds.draw_pile.pop(0)
-        ds.hand.append(card_id)
-        drawn_now.append(card_id)
+        # take as many as the pile holds from the top in one slice instead of pop(0) per card
+        chunk = ds.draw_pile[:remaining]
+        del ds.draw_pile[:remaining]
+        ds.hand.extend(chunk)
+        drawn_now.extend(chunk)
+        remaining -= len(chunk)
 
     return drawn_now, reshuffled_any
 
@@ -135,7 +135,7 @@ def draw_cards(enemy: EnemyInstance, n: int, *, rnd: Optional[random.Random] = N
     Draw up to n fresh cards into enemy.deck_state.hand.
     Existing hand cleanup is a start-of-turn concern.
     """
-    rnd = rnd or random.Random()
+    rnd = rnd or random
 
     ds = enemy.deck_state
     if ds.hand:
@@ -158,7 +158,7 @@ def draw_additional_cards(enemy: EnemyInstance, n: int, *, rnd: Optional[random.
     """
     Draw extra cards into the current hand, used by resolved draw effects.
     """
-    rnd = rnd or random.Random()
+    rnd = rnd or random
     ds = enemy.deck_state
     drawn_now, reshuffled_any = _draw_into_hand(enemy, n, rnd=rnd)
 
@@ -190,7 +190,9 @@ def end_turn(enemy: EnemyInstance) -> None:
     Clears end-of-turn transient statuses.
     Drawn cards remain visible/in hand until this unit's next start turn.
     """
-    on_turn_end(enemy)
+    # The hook only clears statuses and its log is discarded here, so skip it when there are none.
+    if enemy.statuses:
+        on_turn_end(enemy)
 
 
 def enemy_turn(enemy: EnemyInstance, *, rnd: Optional[random.Random] = None) -> DrawResult:
@@ -223,12 +225,7 @@ def enemy_turn(enemy: EnemyInstance, *, rnd: Optional[random.Random] = None) ->
 
 
 def roll_loot_for_enemy(enemy: EnemyInstance, template: EnemyTemplate, *, rnd: Optional[random.Random] = None) -> None:
-    lr = roll_loot(template, rnd=rnd)
-    enemy.rolled_loot = {
-        "currency": dict(lr.currency),
-        "resources": dict(lr.resources),
-        "other": list(lr.other),
-    }
+    enemy.rolled_loot = roll_loot_payload(template, rnd=rnd)
     enemy.loot_rolled = True
 
 # --- battle container ---
@@ -90,7 +90,7 @@ class DungeonState:
     search_check: dict = field(default_factory=dict)                 # default room-search check config
 
 
-@dataclass
+@dataclass(slots=True)
 class DeckState:
     draw_pile: list[str] = field(default_factory=list)     # card_ids in shuffle order
     discard_pile: list[str] = field(default_factory=list)
@@ -107,7 +107,7 @@ class GrappleInstance:
     created_order: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyInstance:
     instance_id: str
     template_id: str
@@ -168,6 +168,9 @@ class EnemyInstance:
     # Creature size (e.g. "Large"), drives the multi-cell grid footprint.
     size: Optional[str] = None
 
+    # Flattened card ids of the current draw groups, shown on the board.
+    visible_draw: list[str] = field(default_factory=list)
+
     def footprint(self) -> int:
         return footprint_for_size(self.size)
 
@@ -3,6 +3,9 @@ from dataclasses import dataclass
 
 from engine.runtime_models import EnemyInstance
 
+# Statuses that only last until the end of the bearer's turn, in removal order.
+TRANSIENT_STATUSES: tuple[str, ...] = ("paralyzed", "slowed")
+
 
 @dataclass(frozen=True)
 class TurnHookLog:
@@ -18,7 +21,7 @@ class TurnHookLog:
 
 def _get_stacks(statuses: dict, key: str) -> int:
     v = statuses.get(key)
-    if v is None:
+    if not v:
         return 0
     # we store as {"stacks": n}
     return int(v.get("stacks", 0))
@@ -31,10 +34,13 @@ def on_turn_start(enemy: EnemyInstance) -> TurnHookLog:
     # 1) reset guard
     enemy.guard_current = int(getattr(enemy, "guard_base", 0))
 
-    # 2) apply DOT (ignores armor/guard)
-    burn = _get_stacks(enemy.statuses, "burn")
-    poison = _get_stacks(enemy.statuses, "poison")
-    dot = max(0, burn) + max(0, poison)
+    # 2) apply DOT (ignores armor/guard); most units carry no statuses at all
+    statuses = enemy.statuses
+    dot = 0
+    if statuses:
+        burn = _get_stacks(statuses, "burn")
+        poison = _get_stacks(statuses, "poison")
+        dot = max(0, burn) + max(0, poison)
 
     if dot > 0:
         enemy.toughness_current = max(0, enemy.toughness_current - dot)
@@ -55,10 +61,12 @@ def on_turn_end(enemy: EnemyInstance) -> TurnHookLog:
     guard_b = enemy.guard_current
 
     removed: list[str] = []
-    for k in ("paralyzed", "slowed"):
-        if k in enemy.statuses:
-            enemy.statuses.pop(k, None)
-            removed.append(k)
+    statuses = enemy.statuses
+    if statuses:
+        for k in TRANSIENT_STATUSES:
+            if k in statuses:
+                del statuses[k]
+                removed.append(k)
 
     return TurnHookLog(
         instance_id=enemy.instance_id,
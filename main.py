@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import argparse
 import random
-import traceback
 from pathlib import Path
 
 from engine.excel_creatures import load_creatures_from_workbook
@@ -57,7 +56,9 @@ def main() -> int:
         action="store_true",
         help="enable image existence check (will fail if /images is missing the file)",
     )
+    parser.add_argument("--quiet", action="store_true", help="run the turn without printing progress")
     args = parser.parse_args()
+    verbose = not args.quiet
 
     root = Path(__file__).parent
     decks_dir = root / "data" / "decks"
@@ -79,65 +80,74 @@ def main() -> int:
         tpl = enemies[args.enemy]
         e = spawn_enemy(tpl, decks, rnd=rnd)
 
-        print("=== SPAWNED ===")
-        print(f"template_id={tpl.id} name={tpl.name} image={tpl.image}")
-        print(
-            f"Toughness {e.toughness_current}/{e.toughness_max} | Armor {e.armor_current}/{e.armor_max} | "
-            f"Magic {e.magic_armor_current}/{e.magic_armor_max} | "
-            f"Guard {getattr(e, 'guard_current', 0)} (base {getattr(e, 'guard_base', 0)})"
-        )
+        if verbose:
+            print("=== SPAWNED ===")
+            print(f"template_id={tpl.id} name={tpl.name} image={tpl.image}")
+            print(
+                f"Toughness {e.toughness_current}/{e.toughness_max} | Armor {e.armor_current}/{e.armor_max} | "
+                f"Magic {e.magic_armor_current}/{e.magic_armor_max} | "
+                f"Guard {getattr(e, 'guard_current', 0)} (base {getattr(e, 'guard_base', 0)})"
+            )
 
         # Ensure we start with base guard (if you spawn with 0, this shows it clearly)
-        print("\n=== TURN START (reset guard to base) ===")
         th = on_turn_start(e)
-        print(f"guard: {th.guard_before} -> {th.guard_after} | toughness: {th.toughness_before} -> {th.toughness_after} | dot={th.dot_damage}")
+        if verbose:
+            print("\n=== TURN START (reset guard to base) ===")
+            print(f"guard: {th.guard_before} -> {th.guard_after} | toughness: {th.toughness_before} -> {th.toughness_after} | dot={th.dot_damage}")
 
         # Simulate a draw turn and auto-apply guard cards (like the UI does)
-        print("\n=== ENEMY TURN (draw + auto-apply guard cards) ===")
         res = enemy_turn(e, rnd=rnd)
-        print(f"drawn ids: {res.drawn}")
-        print("drawn text:", ", ".join(card_to_text(card_index, cid) for cid in res.drawn) or "—")
-
-        guard_added = 0
-        for cid in res.drawn:
-            c = card_index.get(cid)
-            if not c:
-                continue
-            for eff in c.effects:
-                if eff.type == "guard":
-                    apply_heal(e, guard=int(eff.amount))
-                    guard_added += int(eff.amount)
-
-        print(f"auto-guard added from draw: {guard_added}")
-        print(
-            f"after draw: Toughness {e.toughness_current}/{e.toughness_max} | Guard {e.guard_current} (base {getattr(e,'guard_base',0)})"
+        if verbose:
+            print("\n=== ENEMY TURN (draw + auto-apply guard cards) ===")
+            print(f"drawn ids: {res.drawn}")
+            print("drawn text:", ", ".join(card_to_text(card_index, cid) for cid in res.drawn) or "—")
+
+        # sum guard over the drawn slice first, then apply it in a single heal
+        guard_added = sum(
+            int(eff.amount)
+            for cid in res.drawn
+            if (c := card_index.get(cid))
+            for eff in c.effects
+            if eff.type == "guard"
         )
+        if guard_added:
+            apply_heal(e, guard=guard_added)
+
+        if verbose:
+            print(f"auto-guard added from draw: {guard_added}")
+            print(
+                f"after draw: Toughness {e.toughness_current}/{e.toughness_max} | Guard {e.guard_current} (base {getattr(e,'guard_base',0)})"
+            )
 
         # Now test guard as a *consumable pool* with an incoming hit
-        print("\n=== APPLY ATTACK (tests guard consumption) ===")
         dmg = 5
         log = apply_attack(e, dmg, mods=[])
-        print(
-            f"in={log.input_damage} guarded_total={log.guarded_total} damage_to_hp={log.damage_to_hp} "
-            f"Toughness {log.toughness_before}->{log.toughness_after} | Guard {log.guard_before}->{log.guard_after} | "
-            f"Armor {log.armor_before}->{log.armor_after} | Magic {log.magic_armor_before}->{log.magic_armor_after}"
-        )
+        if verbose:
+            print("\n=== APPLY ATTACK (tests guard consumption) ===")
+            print(
+                f"in={log.input_damage} guarded_total={log.guarded_total} damage_to_hp={log.damage_to_hp} "
+                f"Toughness {log.toughness_before}->{log.toughness_after} | Guard {log.guard_before}->{log.guard_after} | "
+                f"Armor {log.armor_before}->{log.armor_after} | Magic {log.magic_armor_before}->{log.magic_armor_after}"
+            )
 
-        print("\n=== END TURN ===")
         end_turn(e)
-        print(f"hand={len(e.deck_state.hand)} discard={len(e.deck_state.discard_pile)}")
+        if verbose:
+            print("\n=== END TURN ===")
+            print(f"hand={len(e.deck_state.hand)} discard={len(e.deck_state.discard_pile)}")
 
         # Next turn start should reset guard back to base again
-        print("\n=== NEXT TURN START (guard reset) ===")
         th2 = on_turn_start(e)
-        print(f"guard: {th2.guard_before} -> {th2.guard_after} | toughness: {th2.toughness_before} -> {th2.toughness_after} | dot={th2.dot_damage}")
-
-        print("\nOK")
+        if verbose:
+            print("\n=== NEXT TURN START (guard reset) ===")
+            print(f"guard: {th2.guard_before} -> {th2.guard_after} | toughness: {th2.toughness_before} -> {th2.toughness_after} | dot={th2.dot_damage}")
+            print("\nOK")
         return 0
 
     except Exception as ex:
         print("\n!!! EXCEPTION !!!")
         print(ex)
+        import traceback
+
         traceback.print_exc()
         return 1
 
@@ -3,11 +3,15 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, List
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces the same documents
+    orjson = None
+
 from engine.runtime_models import DeckState, DungeonIssue, DungeonRoom, DungeonState, DungeonWall, EnemyInstance, GrappleInstance, Tile
 
 
@@ -32,17 +36,53 @@ def _normalize_loot(raw: Any) -> dict:
     }
 
 
-def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def _encode_json(data: Dict[str, Any], *, compact: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _decode_json(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and lone surrogates that older saves written by json may contain.
+            pass
+    return json.loads(raw)
+
+
+def _atomic_write_bytes(path: Path, blob: bytes, *, durable: bool = True) -> None:
+    """Write via a temp file and rename.
+
+    ``durable`` fsyncs before the rename; autosaves skip it because the next
+    turn rewrites them anyway and the rename alone keeps the file whole.
+    """
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with tmp.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.flush()
-        os.fsync(f.fileno())
+    try:
+        f = tmp.open("wb")
+    except FileNotFoundError:
+        # Directories are created up front; only pay for mkdir when one is missing.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = tmp.open("wb")
+    with f:
+        f.write(blob)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
     tmp.replace(path)
 
 
-def _backup_then_write(path: Path, data: Dict[str, Any]) -> None:
+def _atomic_write_json(
+    path: Path, data: Dict[str, Any], *, compact: bool = False, durable: bool = True
+) -> None:
+    _atomic_write_bytes(path, _encode_json(data, compact=compact), durable=durable)
+
+
+def _backup_then_write(path: Path, blob: bytes, *, durable: bool = True) -> None:
     """Write atomically and keep a .bak copy of the previous file if it exists."""
     bak = path.with_suffix(path.suffix + ".bak")
     if path.exists():
@@ -51,7 +91,7 @@ def _backup_then_write(path: Path, data: Dict[str, Any]) -> None:
         except Exception:
             # if backup fails, still try to write the new file
             pass
-    _atomic_write_json(path, data)
+    _atomic_write_bytes(path, blob, durable=durable)
 
 
 def dungeon_state_to_map_template(ds: DungeonState) -> Dict[str, Any]:
@@ -274,38 +314,62 @@ def dungeon_state_from_dict(d: Dict[str, Any]) -> DungeonState:
 
 
 def enemy_to_dict(e: EnemyInstance) -> Dict[str, Any]:
-    # EnemyInstance and DeckState are dataclasses in your project
-    if is_dataclass(e):
-        d = asdict(e)
-    else:
-        d = dict(e.__dict__)
-
-    # Make sure optional runtime extras exist in the save
-    d.setdefault("visible_draw", getattr(e, "visible_draw", getattr(e, "last_drawn", [])))
-    d.setdefault("quick_attack_used", bool(getattr(e, "quick_attack_used", False)))
-    d.setdefault("draw_groups", getattr(e, "draw_groups", []))
-    d.setdefault("pending_reshuffle", bool(getattr(e, "pending_reshuffle", False)))
-    d.setdefault("draw_bonus_pending", int(getattr(e, "draw_bonus_pending", 0)))
-    d.setdefault("draw_bonus_next_turn", int(getattr(e, "draw_bonus_next_turn", 0)))
-    d.setdefault("power_draw_used", bool(getattr(e, "power_draw_used", False)))
-    d.setdefault("is_ko", bool(getattr(e, "is_ko", False)))
-    d.setdefault("physical_cards", bool(getattr(e, "physical_cards", False)))
-    d.setdefault("physical_wounds", int(getattr(e, "physical_wounds", 0)))
-    d.setdefault("opportunity_attack_used_round", int(getattr(e, "opportunity_attack_used_round", 0)))
-    d.setdefault("melee_weapon", dict(getattr(e, "melee_weapon", {}) or {}))
-    d.setdefault("character_profile", dict(getattr(e, "character_profile", {}) or {}))
-    d.setdefault("card_library", dict(getattr(e, "card_library", {}) or {}))
-    d.setdefault("abilities", dict(getattr(e, "abilities", {}) or {}))
-    d.setdefault("specializations", list(getattr(e, "specializations", []) or []))
-    d.setdefault("loot_rolled", getattr(e, "loot_rolled", False))
-    d["rolled_loot"] = _normalize_loot(getattr(e, "rolled_loot", None))
-    d.setdefault("loot_taken_by", getattr(e, "loot_taken_by", None))
-    d["inventory"] = _normalize_loot(getattr(e, "inventory", None))
-    d.setdefault("grid_x", getattr(e, "grid_x", None))
-    d.setdefault("grid_y", getattr(e, "grid_y", None))
-    d.setdefault("room_id", getattr(e, "room_id", None))
-
-    return d
+    # Built by hand instead of dataclasses.asdict: asdict recurses through every
+    # field and deep-copies each leaf, which dominates autosave and snapshot cost.
+    # Containers are copied one level deep; callers only replace top-level keys.
+    deck = e.deck_state
+    return {
+        "instance_id": e.instance_id,
+        "template_id": e.template_id,
+        "name": e.name,
+        "image": e.image,
+        "toughness_current": e.toughness_current,
+        "toughness_max": e.toughness_max,
+        "armor_current": e.armor_current,
+        "armor_max": e.armor_max,
+        "magic_armor_current": e.magic_armor_current,
+        "magic_armor_max": e.magic_armor_max,
+        "guard_base": e.guard_base,
+        "guard_current": e.guard_current,
+        "power_base": e.power_base,
+        "movement": e.movement,
+        "core_deck_id": e.core_deck_id,
+        "initiative_modifier": e.initiative_modifier,
+        "initiative_roll": e.initiative_roll,
+        "initiative_total": e.initiative_total,
+        "initiative_mode": e.initiative_mode,
+        "rolled_loot": _normalize_loot(e.rolled_loot),
+        "loot_rolled": e.loot_rolled,
+        "loot_taken_by": e.loot_taken_by,
+        "inventory": _normalize_loot(e.inventory),
+        "deck_state": {
+            "draw_pile": list(deck.draw_pile),
+            "discard_pile": list(deck.discard_pile),
+            "hand": list(deck.hand),
+        },
+        "quick_attack_used": e.quick_attack_used,
+        "draw_groups": [list(group) for group in e.draw_groups],
+        "pending_reshuffle": e.pending_reshuffle,
+        "draw_bonus_pending": e.draw_bonus_pending,
+        "draw_bonus_next_turn": e.draw_bonus_next_turn,
+        "actions_used": e.actions_used,
+        "power_draw_used": e.power_draw_used,
+        "is_ko": e.is_ko,
+        "physical_cards": e.physical_cards,
+        "physical_wounds": e.physical_wounds,
+        "opportunity_attack_used_round": e.opportunity_attack_used_round,
+        "melee_weapon": dict(e.melee_weapon or {}),
+        "character_profile": dict(e.character_profile or {}),
+        "card_library": dict(e.card_library or {}),
+        "abilities": dict(e.abilities or {}),
+        "specializations": [dict(item) if isinstance(item, dict) else item for item in e.specializations or []],
+        "statuses": {key: dict(value) if isinstance(value, dict) else value for key, value in e.statuses.items()},
+        "grid_x": e.grid_x,
+        "grid_y": e.grid_y,
+        "room_id": e.room_id,
+        "size": e.size,
+        "visible_draw": e.visible_draw,
+    }
 
 
 def enemy_from_dict(d: Dict[str, Any]) -> EnemyInstance:
@@ -437,8 +501,8 @@ def make_save_payload(
             "movement_state": dict(movement_state) if movement_state else None,
         },
         "order": list(order),
-        "enemies": [enemy_to_dict(e) for e in enemies],
-        "grapples": [grapple_to_dict(g) for g in (grapples or [])],
+        "enemies": list(map(enemy_to_dict, enemies)),
+        "grapples": list(map(grapple_to_dict, grapples or ())),
         "dungeon": dungeon_state_to_dict(dungeon) if dungeon is not None else None,
     }
     if undo_stack is not None:
@@ -452,22 +516,27 @@ def load_save_payload(path: Path) -> Optional[Dict[str, Any]]:
     if not path.exists():
         return None
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return _decode_json(path.read_bytes())
     except Exception:
         # try backup if main file is corrupted
         bak = path.with_suffix(path.suffix + ".bak")
         if bak.exists():
             try:
-                with bak.open("r", encoding="utf-8") as f:
-                    return json.load(f)
+                return _decode_json(bak.read_bytes())
             except Exception:
                 return None
         return None
 
 
-def save_current(path: Path, payload: Dict[str, Any]) -> None:
-    _backup_then_write(path, payload)
+def save_current(
+    path: Path, payload: Dict[str, Any], *, compact: bool = False, durable: bool = True
+) -> None:
+    _backup_then_write(path, _encode_json(payload, compact=compact), durable=durable)
+
+
+def save_current_encoded(path: Path, blob: bytes, *, durable: bool = True) -> None:
+    """Like save_current, for a payload the caller already encoded with _encode_json."""
+    _backup_then_write(path, blob, durable=durable)
 
 
 def restore_state_from_payload(
@@ -1,6 +1,11 @@
 ﻿from __future__ import annotations
 
 from collections import Counter
+from dataclasses import fields
+import json
+import os
+import random
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -10,7 +15,9 @@ from engine.combat import WOUND_CARD_ID, apply_attack
 from engine.character_builder import build_character_profile
 from engine.loader import load_decks, load_enemies
 from engine.models import Card, Effect
-from persistence import load_save_payload, save_current
+from engine.runtime import draw_cards
+from engine.runtime_models import EnemyInstance
+from persistence import enemy_from_dict, enemy_to_dict, load_save_payload, save_current
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
@@ -38,6 +45,108 @@ class BattleSessionTests(unittest.TestCase):
         self.assertEqual(snapshot["order"], [])
         self.assertEqual(snapshot["room"], {"columns": 10, "rows": 7})
 
+    def test_coalesced_autosave_writes_once_when_block_exits(self) -> None:
+        session = self.context.create_session("coalesced-autosave")
+        path = self.context.current_path(session.sid)
+        path.unlink()
+
+        with session.coalesced_autosave():
+            session.add_enemy_from_template("C_GOBLIN")
+            session.autosave()
+            self.assertFalse(path.exists())
+
+        self.assertTrue(path.exists())
+        self.assertEqual(len(load_save_payload(path)["enemies"]), 1)
+
+    def test_autosave_skips_write_when_state_is_unchanged(self) -> None:
+        session = self.context.create_session("autosave-unchanged")
+        path = self.context.current_path(session.sid)
+        backup = path.with_suffix(path.suffix + ".bak")
+
+        session.autosave()
+        self.assertFalse(backup.exists())
+
+        session.add_enemy_from_template("C_GOBLIN")
+        self.assertTrue(backup.exists())
+
+    def test_failed_autosave_is_retried_for_the_same_state(self) -> None:
+        session = self.context.create_session("autosave-retry")
+        path = self.context.current_path(session.sid)
+        blocker = path.with_suffix(path.suffix + ".tmp")
+        blocker.mkdir()
+
+        with self.assertRaises(OSError):
+            session.add_enemy_from_template("C_GOBLIN")
+        self.assertIsNone(session._autosave_digest)
+
+        blocker.rmdir()
+        session.autosave()
+        self.assertEqual(len(load_save_payload(path)["enemies"]), 1)
+
+    def test_load_save_payload_accepts_stdlib_only_json(self) -> None:
+        path = Path(self.temp_dir.name) / "legacy.json"
+        path.write_text('{"sid": "legacy", "note": "\\ud800", "ratio": NaN}', encoding="utf-8")
+
+        payload = load_save_payload(path)
+
+        self.assertEqual(payload["sid"], "legacy")
+        self.assertEqual(payload["note"], "\ud800")
+
+    def test_enemy_to_dict_covers_every_enemy_field(self) -> None:
+        session = self.context.create_session("enemy-dict-fields")
+        session.add_enemy_from_template("C_GOBLIN")
+        entity = session.state.enemies[session.selected_id]
+
+        self.assertEqual(set(enemy_to_dict(entity)), {field.name for field in fields(EnemyInstance)})
+
+    def test_enemy_dict_round_trip_preserves_the_instance(self) -> None:
+        session = self.context.create_session("enemy-dict-round-trip")
+        session.add_enemy_from_template("C_GOBLIN")
+        entity = session.state.enemies[session.selected_id]
+        entity.statuses["paralyzed"] = {"stacks": 1}
+        entity.rolled_loot = {"currency": {"cp": 3}, "resources": {}, "other": ["Rusty key"]}
+        entity.loot_rolled = True
+        entity.grid_x, entity.grid_y, entity.room_id = 2, 3, "hall"
+        entity.draw_groups = [entity.deck_state.draw_pile[:2]]
+        entity.visible_draw = list(entity.draw_groups[0])
+
+        self.assertEqual(enemy_from_dict(enemy_to_dict(entity)), entity)
+
+    def test_debounced_autosave_waits_for_flush(self) -> None:
+        self.context.autosave_delay = 60.0
+        session = self.context.create_session("debounced-autosave")
+        path = self.context.current_path(session.sid)
+        self.assertFalse(path.exists())
+
+        session.add_enemy_from_template("C_GOBLIN")
+        session.add_enemy_from_template("C_GOBLIN")
+        self.assertFalse(path.exists())
+
+        self.context.flush_autosaves()
+        self.assertEqual(len(load_save_payload(path)["enemies"]), 2)
+        self.assertIsNone(session._autosave_timer)
+
+    def test_scenario_listing_tracks_renames_and_deletes(self) -> None:
+        created = self.context.create_scenario("Listed")
+        scenario_id = created["id"]
+        self.assertEqual([item["name"] for item in self.context.list_scenarios()], ["Listed"])
+
+        self.context.rename_scenario(scenario_id, "Renamed")
+        self.assertEqual([item["name"] for item in self.context.list_scenarios()], ["Renamed"])
+
+        # Edited in place outside the app: the directory mtime stays put, the file's does not.
+        path = self.context.scenarios_dir / f"{scenario_id}.json"
+        directory_stat = self.context.scenarios_dir.stat()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["name"] = "Edited"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        os.utime(self.context.scenarios_dir, ns=(directory_stat.st_atime_ns, directory_stat.st_mtime_ns))
+        self.assertEqual([item["name"] for item in self.context.list_scenarios()], ["Edited"])
+
+        self.context.delete_scenario(scenario_id)
+        self.assertEqual(self.context.list_scenarios(), [])
+
     def test_scenario_runtime_navigation_phase_and_event_state_persist(self) -> None:
         created = self.context.create_scenario("Scenario Runtime")
         scenario_id = created["id"]
@@ -461,6 +570,33 @@ class BattleSessionTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "does not match enemy category"):
             load_enemies(enemies_dir, decks=decks, images_dir=images_dir)
 
+    def test_deck_cache_is_reused_until_a_deck_file_changes(self) -> None:
+        root = Path(self.temp_dir.name) / "deck-cache"
+        decks_dir = root / "decks"
+        decks_dir.mkdir(parents=True)
+        deck_path = decks_dir / "basic.json"
+        deck_path.write_text(
+            '{"id": "basic", "cards": [{"id": "c1", "effects": [{"type": "attack", "amount": 1}]}]}',
+            encoding="utf-8",
+        )
+        cache_path = root / ".cache" / "decks.pkl"
+
+        first = load_decks(decks_dir, cache_path=cache_path)
+        self.assertTrue(cache_path.exists())
+        cached = load_decks(decks_dir, cache_path=cache_path)
+        self.assertEqual(cached, first)
+        self.assertIs(cached["basic"].cards[0].id, sys.intern("c1"))
+        self.assertIs(cached["basic"].cards[0].effects[0].type, sys.intern("attack"))
+
+        deck_path.write_text(
+            '{"id": "basic", "name": "Renamed", "cards": [{"id": "c1", "effects": [{"type": "attack", "amount": 2}]}]}',
+            encoding="utf-8",
+        )
+        self.assertEqual(load_decks(decks_dir, cache_path=cache_path)["basic"].name, "Renamed")
+
+        cache_path.write_bytes(b"not a pickle")
+        self.assertEqual(load_decks(decks_dir, cache_path=cache_path)["basic"].name, "Renamed")
+
     def test_set_entity_position_requires_free_in_bounds_cell(self) -> None:
         session = self.context.create_session("map-position")
         session.add_enemy_from_template("C_GOBLIN")
@@ -757,6 +893,18 @@ class BattleSessionTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "outside active combat"):
             session.party_walk(leader_id, 0, 0)
 
+    def test_name_suffix_reuses_highest_remaining_number_after_delete(self) -> None:
+        session = self.context.create_session("name-suffixes")
+        for _ in range(3):
+            session.add_enemy_from_template("C_GOBLIN")
+        third_id = session.order[-1]
+
+        session.delete_entity(third_id)
+        session.add_enemy_from_template("C_GOBLIN")
+
+        names = [session.state.enemies[instance_id].name for instance_id in session.order]
+        self.assertEqual(names, ["Goblin 1", "Goblin 2", "Goblin 3"])
+
     def test_copy_entity_creates_fresh_premade_enemy_next_to_source(self) -> None:
         session = self.context.create_session("copy-premade")
         session.add_enemy_from_template("C_GOBLIN")
@@ -2384,6 +2532,41 @@ class BattleSessionTests(unittest.TestCase):
         self.assertEqual(entity.toughness_current, 8)
         self.assertEqual(entity.armor_current, 1)
 
+    def test_draw_cards_takes_from_top_and_reshuffles_discard_once(self) -> None:
+        session = self.context.create_session("draw-batch")
+        session.add_enemy_from_template("C_GOBLIN")
+        entity = session.state.enemies[session.selected_id]
+        entity.deck_state.draw_pile = ["a", "b"]
+        entity.deck_state.discard_pile = ["c", "d", "e"]
+        entity.deck_state.hand = []
+
+        result = draw_cards(entity, 4, rnd=random.Random(3))
+
+        self.assertEqual(result.drawn[:2], ["a", "b"])
+        self.assertTrue(result.reshuffled)
+        self.assertEqual(len(result.drawn), 4)
+        self.assertEqual(entity.deck_state.hand, result.drawn)
+        self.assertEqual(sorted(result.drawn[2:] + entity.deck_state.draw_pile), ["c", "d", "e"])
+        self.assertEqual(entity.deck_state.discard_pile, [])
+
+    def test_attack_modifiers_combine_with_pierce_amounts(self) -> None:
+        session = self.context.create_session("attack-mods")
+        session.add_enemy_from_template("C_GOBLIN")
+        entity = session.state.enemies[session.selected_id]
+        entity.toughness_current = 10
+        entity.toughness_max = 10
+        entity.guard_current = 0
+        entity.armor_current = 3
+        entity.armor_max = 3
+
+        log = apply_attack(entity, 3, mods=["Shatter", "stab"])
+        self.assertEqual(log.damage_to_hp, 2)
+        self.assertEqual(entity.armor_current, 2)
+
+        log = apply_attack(entity, 3, mods=["stab", "pierce:1"])
+        self.assertEqual(log.ignored_regular, 2)
+        self.assertEqual(log.damage_to_hp, 3)
+
     def test_attack_and_heal_can_target_player_cards(self) -> None:
         session = self.context.create_session("player-attack-heal")
         session.add_player(name="Mira", toughness=5, armor=0, magic_armor=0, power=1, movement=5)